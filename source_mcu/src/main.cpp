@@ -51,14 +51,12 @@ CRGB leds[LED_COUNT];
 uint8_t cp_port;
 uint8_t cp_value;
 
-uint16_t cp0_value = 0;
-uint16_t cp1_value = 0;
-uint16_t cp2_value = 0;
-uint16_t cp3_value = 0;
-uint16_t cp4_value = 0;
-uint16_t cp5_value = 0;
-uint16_t cp6_value = 0;
-uint16_t cp7_value = 0;
+// Output data of each Centipede port, indexed by port number
+uint16_t cp_data[8] = {0};
+
+// Output data last sent out over I2C to each Centipede port. All ports get set
+// LOW during `setup()`.
+uint16_t cp_data_sent[8] = {0};
 
 Centipede cp;
 
@@ -114,8 +112,10 @@ bool R_click_poll_EMA_collectively() {
     // Enough time has passed -> Acquire a new reading.
     // Calculate the smoothing factor every time because an exact interval time
     // is not garantueed.
+    // NOTE: Keep all literals and math single precision. The SAMD51 FPU only
+    // handles `float`; any `double` round-trip falls back to slow soft-float.
     EMA_obtained_interval = now - EMA_tick;
-    alpha = 1.f - exp(-float(EMA_obtained_interval) * DAQ_LP * 1e-6);
+    alpha = 1.f - expf(-float(EMA_obtained_interval) * DAQ_LP * 1e-6f);
 
     if (EMA_at_startup) {
       EMA_at_startup = false;
@@ -182,11 +182,8 @@ void setup() {
       if (valve > 0) {
         MATRIX_VALVE2PCS[valve][0] = x;
         MATRIX_VALVE2PCS[valve][1] = y;
-        Serial.print(valve);
-        Serial.write('\t');
-        Serial.print(x);
-        Serial.write('\t');
-        Serial.println(y);
+        snprintf(buf, BUFLEN, "%d\t%d\t%d\n", valve, x, y);
+        Serial.print(buf);
       }
     }
   }
@@ -199,16 +196,13 @@ void setup() {
   for (uint8_t valve = 1; valve < 113; valve++) {
     x = MATRIX_VALVE2PCS[valve][0];
     y = MATRIX_VALVE2PCS[valve][1];
-    Serial.print(valve);
-    Serial.write('\t');
     if ((x == -128) || (y == -128)) {
       inverse_lookup_okay = false;
-      Serial.println("ERROR: Missing valve index!");
+      snprintf(buf, BUFLEN, "%d\tERROR: Missing valve index!\n", valve);
     } else {
-      Serial.print(x);
-      Serial.write('\t');
-      Serial.println(y);
+      snprintf(buf, BUFLEN, "%d\t%d\t%d\n", valve, x, y);
     }
+    Serial.print(buf);
   }
 
   if (!inverse_lookup_okay) {
@@ -366,7 +360,8 @@ void loop() {
   */
 
   // Centipedes
-  // For-loop takes 457 µs in total @ 1 MHz I2C clock
+  // Writing all 8 ports takes 457 µs in total @ 1 MHz I2C clock, hence we
+  // only write out the ports whose data has changed (~57 µs per port).
   EVERY_N_MILLIS(100) {
     // utick = micros();
 
@@ -388,60 +383,19 @@ void loop() {
     cp_port = valve2cp_port(idx_valve);
     cp_value = valve2cp_value(idx_valve);
 
-    Serial.print("valve: ");
-    Serial.print(idx_valve);
-    Serial.print(" @ cp ");
-    Serial.print(cp_port);
-    Serial.print(", ");
-    Serial.println(cp_value);
-
-    cp0_value = 0;
-    cp1_value = 0;
-    cp2_value = 0;
-    cp3_value = 0;
-    cp4_value = 0;
-    cp5_value = 0;
-    cp6_value = 0;
-    cp7_value = 0;
-
-    uint16_t foo = 0;
-    bitSet(foo, cp_value);
-
-    switch (cp_port) {
-      case 0:
-        cp0_value |= foo;
-        break;
-      case 1:
-        cp1_value |= foo;
-        break;
-      case 2:
-        cp2_value |= foo;
-        break;
-      case 3:
-        cp3_value |= foo;
-        break;
-      case 4:
-        cp4_value |= foo;
-        break;
-      case 5:
-        cp5_value |= foo;
-        break;
-      case 6:
-        cp6_value |= foo;
-        break;
-      case 7:
-        cp7_value |= foo;
-        break;
-    }
+    snprintf(buf, BUFLEN, "valve: %d @ cp %d, %d\n", idx_valve, cp_port,
+             cp_value);
+    Serial.print(buf);
+
+    std::fill(cp_data, cp_data + 8, 0);
+    bitSet(cp_data[cp_port], cp_value);
 
-    cp.portWrite(0, cp0_value);
-    cp.portWrite(1, cp1_value);
-    cp.portWrite(2, cp2_value);
-    cp.portWrite(3, cp3_value);
-    cp.portWrite(4, cp4_value);
-    cp.portWrite(5, cp5_value);
-    cp.portWrite(6, cp6_value);
-    cp.portWrite(7, cp7_value);
+    for (uint8_t port = 0; port < 8; port++) {
+      if (cp_data[port] != cp_data_sent[port]) {
+        cp.portWrite(port, cp_data[port]);
+        cp_data_sent[port] = cp_data[port];
+      }
+    }
 
     // Serial.println(micros() - utick);
 